@@ -0,0 +1,76 @@
+"""
+Typical corpus slices through `utils.corpus_store` against the current pandas workflow
+(reload the labeled CSV, then boolean masks and a text scan). Both run in the same group
+per slice, and the store is checked to return the same comments.
+"""
+import pandas as pd
+import pytest
+
+from utils.corpus_store import corpus_store
+from utils.text_filters import normalize_text
+
+PLATFORMS = ["reddit", "youtube", "opengov"]
+PERIODS = ["pre", "during", "post"]
+
+# name: (store filters, pandas mask)
+SLICES = {
+    "valid_topics": (
+        {"exclude_outliers": True},
+        lambda d: (d["dominant_topic"] != -1) & d["dominant_topic"].notna()
+    ),
+    "confident": (
+        {"min_prob": 0.82},
+        lambda d: d["topic_prob"] >= 0.82
+    ),
+    "platform_period_topic_stem": (
+        {"platform": "reddit", "period": "during", "topic": 3, "mentions": ["γάμ"]},
+        lambda d: (d["platform"] == "reddit") & (d["period"] == "during") & (d["dominant_topic"] == 3)
+                  & d["text"].str.contains(r"(?<!\w)γαμ", na=False)
+    ),
+}
+
+
+@pytest.fixture(scope="module")
+def labeled_csv(tmp_path_factory, corpus) -> str:
+    """
+    Labeled dataset shaped like the modeling output, with deterministic labels.
+    """
+    n = len(corpus)
+    data = pd.DataFrame({
+        "platform": [PLATFORMS[i % 3] for i in range(n)],
+        "period": [PERIODS[(i // 3) % 3] for i in range(n)],
+        "date": pd.to_datetime("2023-06-01") + pd.to_timedelta([i % 400 for i in range(n)], unit="D"),
+        "text": [normalize_text(t) for t in corpus],
+        "comment_id": [f"C-{i}" for i in range(n)],
+        "dominant_topic": [(i * 7) % 13 - 1 for i in range(n)],
+        "topic_prob": [((i * 31) % 100) / 100 for i in range(n)]
+    })
+    path = tmp_path_factory.mktemp("corpus") / "labeled.csv"
+    data.to_csv(path, index=False)
+    return str(path)
+
+
+@pytest.fixture(scope="module")
+def store(tmp_path_factory, labeled_csv):
+    db_path = tmp_path_factory.mktemp("corpus") / "corpus.db"
+    with corpus_store.build(str(db_path), pd.read_csv(labeled_csv)) as built:
+        yield built
+
+
+def pandas_slice(labeled_csv, mask):
+    data = pd.read_csv(labeled_csv)
+    return data[mask(data)]
+
+
+@pytest.mark.parametrize("name", list(SLICES))
+def bench_pandas_slice(benchmark, labeled_csv, name):
+    benchmark.group = f"corpus_store-{name}"
+    benchmark(pandas_slice, labeled_csv, SLICES[name][1])
+
+
+@pytest.mark.parametrize("name", list(SLICES))
+def bench_store_slice(benchmark, store, labeled_csv, name):
+    benchmark.group = f"corpus_store-{name}"
+    filters, mask = SLICES[name]
+    result = benchmark(store.query, **filters)
+    assert list(result["comment_id"]) == list(pandas_slice(labeled_csv, mask)["comment_id"])
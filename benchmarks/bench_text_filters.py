@@ -0,0 +1,39 @@
+"""
+Batch filters of `utils.text_filters` against the step-wise per-comment calls they replace
+(`<platform>_specific` followed by `clean_text`). Both run in the same group per platform.
+The step-wise side needs the NLP stack (`data_cleaning`) and is skipped without it; output
+equivalence is checked in tests/test_text_filters.py.
+"""
+import pytest
+
+from utils.modeling_helpers import clean_text
+from utils.text_filters import filter_batch, normalize_text
+
+PLATFORMS = [None, "reddit", "youtube"]
+
+
+def stepwise_filters(cleaner, texts, platform):
+    steps = {
+        None: lambda text: text,
+        "reddit": cleaner.reddit_specific,
+        "youtube": cleaner.youtube_specific
+    }
+    platform_step = steps[platform]
+    return [clean_text(cleaner, platform_step(text)) for text in texts]
+
+
+@pytest.fixture(scope="module")
+def normalized(corpus) -> list[str]:
+    return [normalize_text(t) for t in corpus]
+
+
+@pytest.mark.parametrize("platform", PLATFORMS)
+def bench_stepwise_filters(benchmark, cleaner, normalized, platform):
+    benchmark.group = f"text_filters-{platform}"
+    benchmark(stepwise_filters, cleaner, normalized, platform)
+
+
+@pytest.mark.parametrize("platform", PLATFORMS)
+def bench_filter_batch(benchmark, normalized, platform):
+    benchmark.group = f"text_filters-{platform}"
+    benchmark(filter_batch, normalized, platform)
@@ -0,0 +1,85 @@
+"""
+Benchmarks over the text-processing hot paths of `notebooks/utils`.
+
+Every benchmark processes a whole corpus per round, so the reported times are
+per corpus (anonymized Reddit comments or a scaled synthetic Greek/Greeklish one).
+"""
+import pandas as pd
+import pytest
+
+from conftest import require_nlp_stack
+
+data_cleaning = require_nlp_stack().data_cleaning
+
+from utils.modeling_helpers import split_text_natural_or_equal, clean_text, summarize_doc
+from utils.visualizations import text_language_frequency
+
+PHRASES = ["γάμος ομοφύλων", "ισότητα στο γάμο", "υιοθεσία"]
+
+
+@pytest.mark.benchmark(group="normalize")
+def bench_normalize(benchmark, corpus):
+    benchmark(lambda: [data_cleaning.normalize(t) for t in corpus])
+
+
+@pytest.mark.benchmark(group="contains_mixed_latin_greek")
+def bench_contains_mixed_latin_greek(benchmark, corpus):
+    benchmark(lambda: [data_cleaning.contains_mixed_latin_greek(t) for t in corpus])
+
+
+@pytest.mark.benchmark(group="remove_greek_stopwords")
+def bench_remove_greek_stopwords(benchmark, cleaner, corpus):
+    texts = [data_cleaning.normalize(t) for t in corpus]
+    benchmark(lambda: [cleaner.remove_greek_stopwords(t) for t in texts])
+
+
+@pytest.mark.benchmark(group="word_count")
+def bench_word_count(benchmark, corpus):
+    benchmark(lambda: [data_cleaning.word_count(t) for t in corpus])
+
+
+@pytest.mark.benchmark(group="stem")
+def bench_stem(benchmark, cleaner, small_corpus):
+    texts = [data_cleaning.normalize(t) for t in small_corpus]
+    benchmark.pedantic(lambda: [cleaner.stem(t) for t in texts], rounds=3, iterations=1)
+
+
+@pytest.mark.benchmark(group="filter_content")
+def bench_filter_content(benchmark, cleaner, small_corpus):
+    benchmark.pedantic(
+        lambda: [cleaner.filter_content(t, PHRASES) for t in small_corpus],
+        rounds=3, iterations=1
+    )
+
+
+@pytest.mark.benchmark(group="split_text_natural_or_equal")
+def bench_split_text_natural_or_equal(benchmark, tokenizer, corpus):
+    # a small window forces both the sentence and the token-wise splitting paths
+    benchmark(lambda: [split_text_natural_or_equal(tokenizer, t, max_length=32) for t in corpus])
+
+
+@pytest.mark.benchmark(group="clean_text")
+def bench_clean_text(benchmark, cleaner, corpus):
+    texts = [data_cleaning.normalize(t) for t in corpus]
+    benchmark(lambda: [clean_text(cleaner, t) for t in texts])
+
+
+@pytest.mark.benchmark(group="summarize_doc")
+def bench_summarize_doc(benchmark, tokenizer, topic_model, corpus):
+    # exploded chunk table as built in models_topics, with deterministic topics
+    rows = []
+    for doc_id, text in enumerate(corpus):
+        chunks = split_text_natural_or_equal(tokenizer, text, max_length=32)
+        for i, _ in enumerate(chunks):
+            rows.append({
+                "doc_id": doc_id,
+                "topic": (doc_id + i) % 12 - 1,
+                "topic_prob": ((doc_id * 7 + i) % 100) / 100
+            })
+    exploded = pd.DataFrame(rows)
+    benchmark(lambda: exploded.groupby("doc_id").apply(lambda grp: summarize_doc(grp, topic_model)))
+
+
+@pytest.mark.benchmark(group="text_language_frequency")
+def bench_text_language_frequency(benchmark, forests):
+    benchmark(text_language_frequency, forests, 20)
@@ -0,0 +1,194 @@
+import os, sys, json, random
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(REPO_ROOT, "notebooks"))
+
+REDDIT_PATH = os.path.join(REPO_ROOT, "working_data", "reddit_cleaned_anonymized.json")
+
+# corpus sizes (number of comments) for the scaled synthetic corpora
+SCALES = [100, 1000, 10000]
+
+GREEK_WORDS = """
+γάμος ομόφυλα ζευγάρια ισότητα νομοσχέδιο βουλή ψήφισε εκκλησία οικογένεια παιδιά
+δικαιώματα κοινωνία πολιτική κυβέρνηση αντιπολίτευση υιοθεσία παράδοση θρησκεία
+ελευθερία νόμος σύνταγμα πρωθυπουργός κόμμα βουλευτές ψηφοφορία αγάπη σεβασμός
+και το η ο να δεν για με στην της του που αλλά είναι θα ότι από
+""".split()
+
+GREEKLISH_WORDS = """
+gamos omofyla zeugaria isotita nomosxedio vouli psifise ekklisia oikogeneia paidia
+dikaiomata koinonia politiki kyvernisi yiothesia paradosi thriskeia eleftheria nomos
+kai to na den gia me stin tis tou pou alla einai tha oti apo
+""".split()
+
+NOISE = [
+    "https://www.example.com/article?id=42",
+    "![gif](giphy|3o7TKSjRrfIPjeiVyM|downsized)",
+    "<br>",
+    "\U0001F602\U0001F44D",
+    "2024",
+    "[deleted]",
+    "&quot;",
+    "@user_name",
+]
+
+
+def require_nlp_stack():
+    """
+    Imports `text_analysis_functions`, which loads spaCy's Greek model and the Greek NLP
+    toolkit at import time, skipping the calling benchmarks when they are not available.
+    """
+    try:
+        import utils.text_analysis_functions as text_analysis_functions
+    except (ImportError, OSError) as error:
+        pytest.skip(f"NLP stack unavailable: {error}", allow_module_level=True)
+    return text_analysis_functions
+
+
+def offline_cleaning():
+    """
+    Local stand-in for the cleaning classes: skips the g2g / POS pipelines and the
+    DeepL credentials, and answers the translation call without going to the network.
+    The spaCy model (class attribute) and the Ellogon stemmer are the real ones.
+    """
+    text_analysis_functions = require_nlp_stack()
+    from greek_stemmer import stemmer
+
+    class OfflineCleaning(text_analysis_functions.filtering_pipelines):
+
+        def __init__(self):
+            self.stemmer = stemmer
+
+        def translate_to_greek(self, text):
+            # DeepL flags Greeklish as a non-English source language
+            return "NE"
+
+        def transliterate(self, text):
+            # same control flow as data_cleaning.transliterate, without its debug print
+            # so filter_content does not also time stdout capture
+            if self.contains_mixed_latin_greek(text) == "Latin":
+                transl_txt = self.translate_to_greek(text)
+                if transl_txt == "NE":
+                    return text
+                return transl_txt
+            return text
+
+    return OfflineCleaning()
+
+
+class WhitespaceTokenizer:
+    """
+    Local stand-in for a Hugging Face tokenizer: one id per whitespace token.
+    """
+
+    def __init__(self):
+        self.vocab = {}
+        self.inverse = []
+
+    def __call__(self, text, add_special_tokens=False):
+        ids = []
+        for token in text.split():
+            if token not in self.vocab:
+                self.vocab[token] = len(self.inverse)
+                self.inverse.append(token)
+            ids.append(self.vocab[token])
+        return {"input_ids": ids}
+
+    def decode(self, ids, skip_special_tokens=True):
+        return " ".join(self.inverse[i] for i in ids)
+
+
+class TopicModelStub:
+    """
+    Local stand-in for a fitted BERTopic model, only `get_topic` is used.
+    """
+
+    def get_topic(self, topic):
+        return [(f"word{topic}_{i}", 1.0 / (i + 1)) for i in range(20)]
+
+
+def synthetic_comment(rng: random.Random, greeklish_share: float = 0.3) -> str:
+    """
+    One comment made of Greek or Greeklish sentences with platform noise sprinkled in.
+    """
+    vocabulary = GREEKLISH_WORDS if rng.random() < greeklish_share else GREEK_WORDS
+    sentences = []
+    for _ in range(rng.randint(1, 6)):
+        words = rng.choices(vocabulary, k=rng.randint(4, 25))
+        if rng.random() < 0.2:
+            words.insert(rng.randrange(len(words)), rng.choice(NOISE))
+        sentences.append(" ".join(words) + rng.choice([".", "!", ";", "?"]))
+    return " ".join(sentences)
+
+
+def synthetic_corpus(size: int, seed: int = 2024) -> list[str]:
+    rng = random.Random(seed)
+    return [synthetic_comment(rng) for _ in range(size)]
+
+
+def synthetic_forests(size: int, seed: int = 2024) -> list[dict]:
+    """
+    Reddit-shaped threads ({"comments": [{"body": ...}]}) holding `size` comments,
+    with repeated bodies so the frequency counts are non trivial.
+    """
+    rng = random.Random(seed)
+    pool = synthetic_corpus(max(size // 5, 1), seed)
+    forests = []
+    for start in range(0, size, 50):
+        comments = [{"body": rng.choice(pool)} for _ in range(min(50, size - start))]
+        forests.append({"comments": comments})
+    return forests
+
+
+@pytest.fixture(scope="session")
+def reddit_forests() -> list[dict]:
+    with open(REDDIT_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="session")
+def reddit_bodies(reddit_forests) -> list[str]:
+    return [c["body"] for thread in reddit_forests for c in thread.get("comments", []) if c.get("body")]
+
+
+@pytest.fixture(scope="session", params=["reddit"] + SCALES)
+def corpus(request, reddit_bodies) -> list[str]:
+    """
+    The anonymized Reddit comments and the scaled synthetic corpora.
+    """
+    if request.param == "reddit":
+        return reddit_bodies
+    return synthetic_corpus(request.param)
+
+
+@pytest.fixture(scope="session", params=["reddit"] + SCALES[:2])
+def small_corpus(request, reddit_bodies) -> list[str]:
+    """
+    Smaller corpora for the spaCy-bound steps (stemming, content filtering).
+    """
+    if request.param == "reddit":
+        return reddit_bodies[:SCALES[1]]
+    return synthetic_corpus(request.param)
+
+
+@pytest.fixture(scope="session")
+def cleaner():
+    return offline_cleaning()
+
+
+@pytest.fixture(scope="session")
+def tokenizer() -> WhitespaceTokenizer:
+    return WhitespaceTokenizer()
+
+
+@pytest.fixture(scope="session")
+def topic_model() -> TopicModelStub:
+    return TopicModelStub()
+
+
+@pytest.fixture(scope="session", params=["reddit"] + SCALES)
+def forests(request, reddit_forests) -> list[dict]:
+    if request.param == "reddit":
+        return reddit_forests
+    return synthetic_forests(request.param)
@@ -0,0 +1,251 @@
+import re, sqlite3
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+import pandas as pd
+from .text_filters import normalize_text
+
+# B-tree indexed columns, always present in the store (NULL when missing from the data)
+INDEXED_COLUMNS = ["platform", "period", "date", "author_id", "dominant_topic", "topic_prob"]
+
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+def _plain(value: Any) -> Any:
+    """
+    Numpy scalars (e.g. from `df["dominant_topic"].unique()`) as plain Python values,
+    sqlite3 would otherwise bind them as BLOBs that never compare equal.
+    """
+    return value.item() if hasattr(value, "item") else value
+
+def _values(value: Any) -> List[Any]:
+    """
+    A filter value as a list of plain values: strings and scalars are single values, any
+    other iterable (list, set, np.ndarray, pd.Series, ...) is a list of them.
+    """
+    if isinstance(value, str) or not hasattr(value, "__iter__"):
+        return [_plain(value)]
+    return [_plain(v) for v in value]
+
+def _to_naive_utc(dates: pd.Series) -> pd.Series:
+    """
+    Parses dates as written by the anonymize notebook: Reddit without a timezone and YouTube
+    with a UTC offset. Both end up as naive UTC, so they can be stored and compared as text.
+    """
+    return pd.to_datetime(dates, errors="coerce", utc=True, format="ISO8601").dt.tz_localize(None)
+
+def _date_param(date: Any) -> str:
+    timestamp = pd.Timestamp(date)
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.tz_convert("UTC").tz_localize(None)
+    return timestamp.strftime(DATE_FORMAT)
+
+def author_ids_from_anonymized(youtube_data, reddit_data, ogov_data) -> Dict[str, Any]:
+    """
+    Maps every `unique_comment_id` of the anonymized outputs to its `author_id`, so that
+    the labeled table (which only keeps `comment_id`) can be sliced per author.
+
+    Args:
+        youtube_data, reddit_data (list): Anonymized forests ({"comments": [...]})
+        ogov_data (list): Anonymized OpenGov entries
+
+    Returns:
+        author_ids (dict): {unique_comment_id: author_id}
+    """
+    author_ids = {}
+    for forest in list(youtube_data) + list(reddit_data):
+        for comment in forest.get("comments", []):
+            author_ids[comment["unique_comment_id"]] = comment.get("author_id")
+    for entry in ogov_data:
+        author_ids[entry["unique_comment_id"]] = entry.get("author_id")
+    return author_ids
+
+class corpus_store:
+    """
+    Persistent SQLite store of the labeled corpus: one row per comment with B-tree indexes on
+    platform, period, date, author_id, dominant_topic and topic_prob, and an FTS5 index over
+    the normalized (accent-stripped, lowercase) text for keyword and stem lookups.
+
+    Built once with `corpus_store.build`, then opened and sliced with `query` / `iter_query`
+    instead of reloading and masking the full CSV.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.connection = sqlite3.connect(db_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    @classmethod
+    def build(cls, db_path: str, data: pd.DataFrame,
+              author_ids: Optional[Dict[str, Any]] = None) -> "corpus_store":
+        """
+        (Re)creates the store at `db_path` from the labeled dataset.
+
+        Args:
+            db_path (str): SQLite file path
+            data (pd.DataFrame): Labeled dataset, needs at least "text" and "platform"
+            author_ids (dict | None): {comment_id: author_id}, see `author_ids_from_anonymized`
+
+        Returns:
+            store (corpus_store): The opened store
+        """
+        missing = [col for col in ("text", "platform") if col not in data.columns]
+        if missing:
+            raise ValueError(f"Columns {missing} are missing from `data`.")
+
+        frame = data.copy()
+        if author_ids is not None and "comment_id" in frame.columns:
+            frame["author_id"] = frame["comment_id"].map(author_ids)
+        if "author_id" in frame.columns:
+            frame["author_id"] = frame["author_id"].astype("Int64")
+        for col in INDEXED_COLUMNS:
+            if col not in frame.columns:
+                frame[col] = None
+        frame["date"] = _to_naive_utc(frame["date"]).dt.strftime(DATE_FORMAT)
+        frame.insert(0, "row_id", range(len(frame)))
+
+        store = cls(db_path)
+        con = store.connection
+        con.executescript("""
+            DROP TABLE IF EXISTS comments;
+            DROP TABLE IF EXISTS comments_fts;
+        """)
+        con.execute(pd.io.sql.get_schema(frame, "comments", keys="row_id", con=con))
+        frame.to_sql("comments", con, if_exists="append", index=False)
+        for col in INDEXED_COLUMNS:
+            con.execute(f'CREATE INDEX "idx_comments_{col}" ON comments ("{col}")')
+
+        # contentless full-text index, its rowid is comments.row_id
+        con.execute("""
+            CREATE VIRTUAL TABLE comments_fts USING fts5(
+                text_norm, content='', prefix='3 4', tokenize='unicode61 remove_diacritics 2'
+            )
+        """)
+        con.executemany(
+            "INSERT INTO comments_fts (rowid, text_norm) VALUES (?, ?)",
+            (
+                (row_id, normalize_text(text) if isinstance(text, str) else "")
+                for row_id, text in zip(range(len(frame)), frame["text"])
+            )
+        )
+        con.commit()
+        return store
+
+    @staticmethod
+    def _match_expression(mentions: Union[str, Sequence[str]], prefix: bool) -> str:
+        """
+        FTS5 expression matching any of `mentions` (words, stems or phrases), normalized
+        the same way as the indexed text.
+        """
+        if isinstance(mentions, str):
+            mentions = [mentions]
+        terms = []
+        for mention in mentions:
+            # word tokens only, as split by the unicode61 tokenizer (normalize keeps .?!;@)
+            tokens = re.findall(r"\w+", normalize_text(mention))
+            if not tokens:
+                continue
+            phrase = '"' + " ".join(tokens) + '"'
+            terms.append(phrase + " *" if prefix else phrase)
+        if not terms:
+            raise ValueError("`mentions` has no searchable words after normalization.")
+        return " OR ".join(terms)
+
+    def _select(self,
+                columns: Optional[List[str]] = None,
+                platform: Optional[Union[str, List[str]]] = None,
+                period: Optional[Union[str, List[str]]] = None,
+                topic: Optional[Union[int, List[int]]] = None,
+                min_prob: Optional[float] = None,
+                date_from: Optional[str] = None,
+                date_to: Optional[str] = None,
+                author_id: Optional[Union[int, List[int]]] = None,
+                exclude_outliers: bool = False,
+                mentions: Optional[Union[str, Sequence[str]]] = None,
+                prefix: bool = True) -> Tuple[str, List[Any]]:
+        clauses, params = [], []
+
+        def equals(col, value):
+            values = _values(value)
+            clauses.append(f'"{col}" IN ({", ".join("?" * len(values))})')
+            params.extend(values)
+
+        if platform is not None:
+            equals("platform", platform)
+        if period is not None:
+            equals("period", period)
+        if topic is not None:
+            equals("dominant_topic", topic)
+        if author_id is not None:
+            equals("author_id", author_id)
+        if exclude_outliers:
+            clauses.append("dominant_topic IS NOT NULL AND dominant_topic != -1")
+        if min_prob is not None:
+            clauses.append("topic_prob >= ?")
+            params.append(_plain(min_prob))
+        if date_from is not None:
+            clauses.append("date >= ?")
+            params.append(_date_param(date_from))
+        if date_to is not None:
+            clauses.append("date <= ?")
+            params.append(_date_param(date_to))
+        if mentions:
+            clauses.append("row_id IN (SELECT rowid FROM comments_fts WHERE comments_fts MATCH ?)")
+            params.append(self._match_expression(mentions, prefix))
+
+        selected = ", ".join(f'"{col}"' for col in columns) if columns else "*"
+        sql = f"SELECT {selected} FROM comments"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        return sql + " ORDER BY row_id", params
+
+    def query(self, columns: Optional[List[str]] = None, **filters) -> pd.DataFrame:
+        """
+        Returns the comments matching all the given filters, in the original row order.
+
+        Args:
+            columns (List[str] | None): Columns to return, all by default
+            platform, period (str | List[str]): Exact values to keep, lists may be any iterable
+            topic (int | List[int]): Dominant topic(s) to keep, e.g. `df["dominant_topic"].unique()`
+            min_prob (float): Minimum topic_prob
+            date_from, date_to (str): Inclusive date bounds, offsets are converted to UTC
+            author_id (int | List[int]): Author(s) to keep
+            exclude_outliers (bool): Drop dominant_topic -1 and missing topics
+            mentions (str | List[str]): Words, stems or phrases, any of which must appear in the text
+            prefix (bool): Match `mentions` as prefixes (stems), True by default
+
+        Returns:
+            slice (pd.DataFrame): The matching rows
+        """
+        sql, params = self._select(columns, **filters)
+        frame = pd.read_sql_query(sql, self.connection, params=params)
+        if "date" in frame.columns:
+            frame["date"] = pd.to_datetime(frame["date"], format=DATE_FORMAT, errors="coerce")
+        if "author_id" in frame.columns:
+            frame["author_id"] = frame["author_id"].astype("Int64")
+        return frame.drop(columns="row_id", errors="ignore")
+
+    def iter_query(self, columns: Optional[List[str]] = None, **filters) -> Iterator[Dict[str, Any]]:
+        """
+        Same filters as `query`, yielding one dictionary per comment without building a DataFrame.
+        """
+        sql, params = self._select(columns, **filters)
+        cursor = self.connection.execute(sql, params)
+        names = [description[0] for description in cursor.description]
+        for row in cursor:
+            record = dict(zip(names, row))
+            record.pop("row_id", None)
+            yield record
+
+    def count(self, **filters) -> int:
+        """
+        Number of comments matching the filters of `query`.
+        """
+        sql, params = self._select(["row_id"], **filters)
+        sql = f"SELECT COUNT(*) FROM ({sql})"
+        return self.connection.execute(sql, params).fetchone()[0]
@@ -1,5 +1,6 @@
 import math, re
 import pandas as pd
+from .text_filters import TOPIC_NOISE_PATTERN, REPEATED_PATTERN
 
 def split_text_natural_or_equal(tokenizer, text: str, max_length: int = 512) -> list[str]:
     # tokenize and measure
@@ -51,24 +52,8 @@ def split_text_natural_or_equal(tokenizer, text: str, max_length: int = 512) ->
 
 def clean_text(cleaning_object, text: str) -> str:
 
-    patterns_to_remove = [
-    "διαφωνω",
-    "συμφωνω",
-    "νομοσχεδιο",
-    "νομοσχεδιου"]
-
-    repeated_pattern = re.compile(
-        r'''
-        \b\w*(\w)\1{2,}\b | # single character repeated 3+ times
-        \b(\w{2})\2{2,}\b # a two-character sequence repeated 3+ times
-        ''',
-        flags=re.VERBOSE | re.UNICODE
-    )
-    
-    literal_pattern = "|".join(map(re.escape, patterns_to_remove))
-    
-    text = re.sub(literal_pattern, "", text, flags=re.IGNORECASE)
-    text = repeated_pattern.sub("", text)
+    text = TOPIC_NOISE_PATTERN.sub("", text)
+    text = REPEATED_PATTERN.sub("", text)
 
     text = cleaning_object.remove_greek_stopwords(text)
 
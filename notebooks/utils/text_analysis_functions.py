@@ -6,6 +6,7 @@ from greek_stemmer import stemmer
 from dotenv import load_dotenv
 from gr_nlp_toolkit import Pipeline
 from tqdm import tqdm
+from .text_filters import GREEK_ACCENTS, GREEK_STOPWORDS, WHITESPACE_PATTERN, normalize_text, remove_platform_noise
 
 class data_cleaning:
 
@@ -57,7 +58,7 @@ class data_cleaning:
 
     @staticmethod
     def remove_greek_accents(text: str) -> str:
-        text = text.translate(str.maketrans('άέόώήύϋΰίϊΐ', 'αεοωηυυυιιι'))
+        text = text.translate(GREEK_ACCENTS)
         return text
 
     @staticmethod
@@ -74,43 +75,7 @@ class data_cleaning:
         9) remove special characters (keep letters, spaces)
         10) Collapse whitespace, lowercase
         """
-        # strip Giphy embeds
-        text = re.sub(r'!\[[^\]]*\]\(giphy\|[^)]+\)', ' ', text)
-        # strip other Markdown images
-        text = re.sub(r'!\[[^\]]*\]\([^\)]*\)', ' ', text)
-        # strip parenthesized URLs
-        text = re.sub(r'\(\s*https?://[^)]+\)', ' ', text)
-        # strip bare URLs
-        text = re.sub(r'http\S+|www\.\S+|https\S+', ' ', text)
-        # strip HTML tags
-        text = re.sub(r'<[^>]+>', ' ', text)
-        # remove emojis
-        emoji_pattern = re.compile(
-            "["
-            "\U0001F600-\U0001F64F" # emoticons
-            "\U0001F300-\U0001F5FF" # symbols & pictographs
-            "\U0001F680-\U0001F6FF" # transport & map
-            "\U0001F1E0-\U0001F1FF" # flags
-            "\U00002702-\U000027B0" # dingbats
-            "\U000024C2-\U0001F251" # enclosed chars
-            "\U0000200D" # zero-width joiner
-            "\U0001F900-\U0001F9FF" # supplemental symbols
-            "\U0001FA70-\U0001FAFF" # extended-A
-            "\U0001FAD0-\U0001FADF" # food & drink
-            "]+", flags=re.UNICODE
-        )
-
-        text = emoji_pattern.sub(' ', text)
-        # remove digits
-        text = re.sub(r'\d+', ' ', text)
-        # remove special characters (keep letters, spaces)
-        text = re.sub(r'[^\w\s@.?!;]', ' ', text, flags=re.UNICODE)
-        text = text.replace('_', ' ')
-        # collapse whitespace & lowercase
-        text = re.sub(r'\s+', ' ', text).strip().lower()
-        # remove Greek accents
-        text = data_cleaning.remove_greek_accents(text)
-        return text
+        return normalize_text(text)
 
     @staticmethod
     def contains_mixed_latin_greek(text: str) -> str:
@@ -255,110 +220,19 @@ class data_cleaning:
 
         Args:
             text (str): A cleaned string of space-separated words.
-            stopwords (set): A set of stopwords (no accents).
 
         Returns:
             str: The text without stopwords.
         """
-        greek_stopwords = set(
-            data_cleaning.remove_greek_accents("""
-            αδιάκοπα αι ακόμα ακόμη ακριβώς άλλα αλλά αλλαχού άλλες άλλη άλλην
-            άλλης αλλιώς αλλιώτικα άλλο άλλοι αλλοιώς αλλοιώτικα άλλον άλλος άλλοτε αλλού
-            άλλους άλλων άμα άμεσα αμέσως αν ανά ανάμεσα αναμεταξύ άνευ αντί αντίπερα αντίς
-            άνω ανωτέρω άξαφνα απ απέναντι από απόψε άρα άραγε αρκετά αρκετές
-            αρχικά ας αύριο αυτά αυτές αυτή αυτήν αυτής αυτό αυτοί αυτόν αυτός αυτού αυτούς
-            αυτών αφότου αφού
-
-            βέβαια βεβαιότατα
-
-            γι για γιατί γρήγορα γύρω
-
-            δα δε δείνα δεν δεξιά δήθεν δηλαδή δι δια διαρκώς δικά δικό δικοί δικός δικού
-            δικούς διόλου δίπλα δίχως
-
-            εάν εαυτό εαυτόν εαυτού εαυτούς εαυτών έγκαιρα εγκαίρως εγώ εδώ ειδεμή είθε είμαι
-            είμαστε είναι εις είσαι είσαστε είστε είτε είχα είχαμε είχαν είχατε είχε είχες έκαστα
-            έκαστες έκαστη έκαστην έκαστης έκαστο έκαστοι έκαστον έκαστος εκάστου εκάστους εκάστων
-            εκεί εκείνα εκείνες εκείνη εκείνην εκείνης εκείνο εκείνοι εκείνον εκείνος εκείνου
-            εκείνους εκείνων εκτός εμάς εμείς εμένα εμπρός εν ένα έναν ένας ενός εντελώς εντός
-            εναντίον  εξής  εξαιτίας  επιπλέον επόμενη εντωμεταξύ ενώ εξ έξαφνα εξήσ εξίσου έξω επάνω
-            επειδή έπειτα επί επίσης επομένως εσάς εσείς εσένα έστω εσύ ετέρα ετέραι ετέρας έτερες
-            έτερη έτερης έτερο έτεροι έτερον έτερος ετέρου έτερους ετέρων ετούτα ετούτες ετούτη ετούτην
-            ετούτης ετούτο ετούτοι ετούτον ετούτος ετούτου ετούτους ετούτων έτσι εύγε ευθύς ευτυχώς εφεξής
-            έχει έχεις έχετε έχομε έχουμε έχουν εχτές έχω έως έγιναν  έγινε  έκανε  έξι  έχοντας
-
-            η ήδη ήμασταν ήμαστε ήμουν ήσασταν ήσαστε ήσουν ήταν ήτανε ήτοι ήττον
-
-            θα
-
-            ι ιδία ίδια ίδιαν ιδίας ίδιες ίδιο ίδιοι ίδιον ίδιοσ ίδιος ιδίου ίδιους ίδιων ιδίως ιι ιιι
-            ίσαμε ίσια ίσως
-
-            κάθε καθεμία καθεμίας καθένα καθένας καθενός καθετί καθόλου καθώς και κακά κακώς καλά
-            καλώς καμία καμίαν καμίας κάμποσα κάμποσες κάμποση κάμποσην κάμποσης κάμποσο κάμποσοι
-            κάμποσον κάμποσος κάμποσου κάμποσους κάμποσων κανείς κάνεν κανένα κανέναν κανένας
-            κανενός κάποια κάποιαν κάποιας κάποιες κάποιο κάποιοι κάποιον κάποιος κάποιου κάποιους
-            κάποιων κάποτε κάπου κάπως κατ κατά κάτι κατιτί κατόπιν κάτω κιόλας κλπ κοντά κτλ κυρίως
-
-            λιγάκι λίγο λιγότερο λόγω λοιπά λοιπόν
-
-            μα μαζί μακάρι μακρυά μάλιστα μάλλον μας με μεθαύριο μείον μέλει μέλλεται μεμιάς μεν
-            μερικά μερικές μερικοί μερικούς μερικών μέσα μετ μετά μεταξύ μέχρι μη μήδε μην μήπως
-            μήτε μια μιαν μιας μόλις μολονότι μονάχα μόνες μόνη μόνην μόνης μόνο μόνοι μονομιάς
-            μόνος μόνου μόνους μόνων μου μπορεί μπορούν μπρος μέσω  μία  μεσώ
-
-            να ναι νωρίς
-
-            ξανά ξαφνικά
-
-            ο οι όλα όλες όλη όλην όλης όλο ολόγυρα όλοι όλον ολονέν όλος ολότελα όλου όλους όλων
-            όλως ολωσδιόλου όμως όποια οποιαδήποτε οποίαν οποιανδήποτε οποίας οποίος οποιασδήποτε οποιδήποτε
-            όποιες οποιεσδήποτε όποιο οποιοδηήποτε όποιοι όποιον οποιονδήποτε όποιος οποιοσδήποτε
-            οποίου οποιουδήποτε οποίους οποιουσδήποτε οποίων οποιωνδήποτε όποτε οποτεδήποτε όπου
-            οπουδήποτε όπως ορισμένα ορισμένες ορισμένων ορισμένως όσα οσαδήποτε όσες οσεσδήποτε
-            όση οσηδήποτε όσην οσηνδήποτε όσης οσησδήποτε όσο οσοδήποτε όσοι οσοιδήποτε όσον οσονδήποτε
-            όσος οσοσδήποτε όσου οσουδήποτε όσους οσουσδήποτε όσων οσωνδήποτε όταν ότι οτιδήποτε
-            ότου ου ουδέ ούτε όχι οποία  οποίες  οποίο  οποίοι  οπότε  ος
-
-            πάνω  παρά  περί  πολλά  πολλές  πολλοί  πολλούς  που  πρώτα  πρώτες  πρώτη  πρώτο  πρώτος  πως
-            πάλι πάντα πάντοτε παντού πάντως πάρα πέρα πέρι περίπου περισσότερο πέρσι πέρυσι πια πιθανόν
-            πιο πίσω πλάι πλέον πλην ποιά ποιάν ποιάς ποιές ποιό ποιοί ποιόν ποιός ποιού ποιούς
-            ποιών πολύ πόσες πόση πόσην πόσης πόσοι πόσος πόσους πότε ποτέ πού πούθε πουθενά πρέπει
-            πριν προ προκειμένου πρόκειται πρόπερσι προς προτού προχθές προχτές πρωτύτερα πώς
-
-            σαν σας σε σεις σου στα στη στην στης στις στο στον στου στους στων συγχρόνως
-            συν συνάμα συνεπώς συχνάς συχνές συχνή συχνήν συχνής συχνό συχνοί συχνόν
-            συχνός συχνού συχνούς συχνών συχνώς σχεδόν
-
-            τα τάδε ταύτα ταύτες ταύτη ταύτην ταύτης ταύτοταύτον ταύτος ταύτου ταύτων τάχα τάχατε
-            τελευταία  τελευταίο  τελευταίος  τού  τρία  τρίτη  τρεις τελικά τελικώς τες τέτοια τέτοιαν
-            τέτοιας τέτοιες τέτοιο τέτοιοι τέτοιον τέτοιος τέτοιου
-            τέτοιους τέτοιων τη την της τι τίποτα τίποτε τις το τοι τον τοσ τόσα τόσες τόση τόσην
-            τόσης τόσο τόσοι τόσον τόσος τόσου τόσους τόσων τότε του τουλάχιστο τουλάχιστον τους τούς τούτα
-            τούτες τούτη τούτην τούτης τούτο τούτοι τούτοις τούτον τούτος τούτου τούτους τούτων τυχόν
-            των τώρα
-
-            υπ υπέρ υπό υπόψη υπόψιν ύστερα
-
-            χωρίς χωριστά
-
-            ω ως ωσάν ωσότου ώσπου ώστε ωστόσο ωχ κ κι
-            """).split()
-        )
-        return " ".join(word for word in text.split() if word not in greek_stopwords)
+        return " ".join(word for word in text.split() if word not in GREEK_STOPWORDS)
 
     def youtube_specific(self, text: str) -> str:
         """
         Any YouTube specific noise cleaning.
         E.g. @account_name in replies remains
         """
-        text = re.sub(r"^@\S+\s+", "", text) # for remaining replying names
-        direct_phrases = ["quot", "href"]
-        for phrase in direct_phrases:
-            text = text.replace(phrase, "")
-
-        text = re.sub(r'@\w+', ' ', text)
-        cleaned = re.sub(r'\s+', ' ', text).strip()
+        text = remove_platform_noise(text, "youtube")
+        cleaned = WHITESPACE_PATTERN.sub(" ", text).strip()
 
         return cleaned
 
@@ -367,22 +241,8 @@ class data_cleaning:
         Any Reddit specific noise cleaning.
         E.g. [deleted] when comment is deleted from the user or moderator
         """
-        direct_phrases = ["deleted", "removed", "quot", "href"]
-        full_removal_triggers = [
-            "δεν επιτρέπονται σύνδεσμοι προς σελίδες google amp το σχόλιό σου έχει αφαιρεθεί μπορείς όμως να το",
-            "δεν επιτρεπονται συνδεσμοι προς σελιδες google amp το σχολιο σου εχει αφαιρεθει μπορεις ομως να το επεξεργαστεις και να ενημερωσεις τους",
-            "ο τίτλος στο σαιτ αλλάζει συνεχώς για αυτό πιθανότατα",
-            "ο τιτλος στο σαιτ αλλαζει συνεχως για αυτο πιθανοτατα"
-        ]
-
-        for trigger in full_removal_triggers:
-            if trigger in text:
-                return ""
-
-        for phrase in direct_phrases:
-            text = text.replace(phrase, "")
-
-        text = re.sub(r"\s+", " ", text).strip()
+        text = remove_platform_noise(text, "reddit")
+        text = WHITESPACE_PATTERN.sub(" ", text).strip()
         return text
 
 class filtering_pipelines(data_cleaning):
@@ -0,0 +1,227 @@
+import re
+from typing import Iterable, List, Optional
+
+# Built once at import time and shared by `data_cleaning`, `modeling_helpers.clean_text`
+# and the batch filters below, instead of being rebuilt on every call.
+
+GREEK_ACCENTS = str.maketrans('άέόώήύϋΰίϊΐ', 'αεοωηυυυιιι')
+
+GREEK_STOPWORDS = frozenset(
+    """
+    αδιάκοπα αι ακόμα ακόμη ακριβώς άλλα αλλά αλλαχού άλλες άλλη άλλην
+    άλλης αλλιώς αλλιώτικα άλλο άλλοι αλλοιώς αλλοιώτικα άλλον άλλος άλλοτε αλλού
+    άλλους άλλων άμα άμεσα αμέσως αν ανά ανάμεσα αναμεταξύ άνευ αντί αντίπερα αντίς
+    άνω ανωτέρω άξαφνα απ απέναντι από απόψε άρα άραγε αρκετά αρκετές
+    αρχικά ας αύριο αυτά αυτές αυτή αυτήν αυτής αυτό αυτοί αυτόν αυτός αυτού αυτούς
+    αυτών αφότου αφού
+
+    βέβαια βεβαιότατα
+
+    γι για γιατί γρήγορα γύρω
+
+    δα δε δείνα δεν δεξιά δήθεν δηλαδή δι δια διαρκώς δικά δικό δικοί δικός δικού
+    δικούς διόλου δίπλα δίχως
+
+    εάν εαυτό εαυτόν εαυτού εαυτούς εαυτών έγκαιρα εγκαίρως εγώ εδώ ειδεμή είθε είμαι
+    είμαστε είναι εις είσαι είσαστε είστε είτε είχα είχαμε είχαν είχατε είχε είχες έκαστα
+    έκαστες έκαστη έκαστην έκαστης έκαστο έκαστοι έκαστον έκαστος εκάστου εκάστους εκάστων
+    εκεί εκείνα εκείνες εκείνη εκείνην εκείνης εκείνο εκείνοι εκείνον εκείνος εκείνου
+    εκείνους εκείνων εκτός εμάς εμείς εμένα εμπρός εν ένα έναν ένας ενός εντελώς εντός
+    εναντίον  εξής  εξαιτίας  επιπλέον επόμενη εντωμεταξύ ενώ εξ έξαφνα εξήσ εξίσου έξω επάνω
+    επειδή έπειτα επί επίσης επομένως εσάς εσείς εσένα έστω εσύ ετέρα ετέραι ετέρας έτερες
+    έτερη έτερης έτερο έτεροι έτερον έτερος ετέρου έτερους ετέρων ετούτα ετούτες ετούτη ετούτην
+    ετούτης ετούτο ετούτοι ετούτον ετούτος ετούτου ετούτους ετούτων έτσι εύγε ευθύς ευτυχώς εφεξής
+    έχει έχεις έχετε έχομε έχουμε έχουν εχτές έχω έως έγιναν  έγινε  έκανε  έξι  έχοντας
+
+    η ήδη ήμασταν ήμαστε ήμουν ήσασταν ήσαστε ήσουν ήταν ήτανε ήτοι ήττον
+
+    θα
+
+    ι ιδία ίδια ίδιαν ιδίας ίδιες ίδιο ίδιοι ίδιον ίδιοσ ίδιος ιδίου ίδιους ίδιων ιδίως ιι ιιι
+    ίσαμε ίσια ίσως
+
+    κάθε καθεμία καθεμίας καθένα καθένας καθενός καθετί καθόλου καθώς και κακά κακώς καλά
+    καλώς καμία καμίαν καμίας κάμποσα κάμποσες κάμποση κάμποσην κάμποσης κάμποσο κάμποσοι
+    κάμποσον κάμποσος κάμποσου κάμποσους κάμποσων κανείς κάνεν κανένα κανέναν κανένας
+    κανενός κάποια κάποιαν κάποιας κάποιες κάποιο κάποιοι κάποιον κάποιος κάποιου κάποιους
+    κάποιων κάποτε κάπου κάπως κατ κατά κάτι κατιτί κατόπιν κάτω κιόλας κλπ κοντά κτλ κυρίως
+
+    λιγάκι λίγο λιγότερο λόγω λοιπά λοιπόν
+
+    μα μαζί μακάρι μακρυά μάλιστα μάλλον μας με μεθαύριο μείον μέλει μέλλεται μεμιάς μεν
+    μερικά μερικές μερικοί μερικούς μερικών μέσα μετ μετά μεταξύ μέχρι μη μήδε μην μήπως
+    μήτε μια μιαν μιας μόλις μολονότι μονάχα μόνες μόνη μόνην μόνης μόνο μόνοι μονομιάς
+    μόνος μόνου μόνους μόνων μου μπορεί μπορούν μπρος μέσω  μία  μεσώ
+
+    να ναι νωρίς
+
+    ξανά ξαφνικά
+
+    ο οι όλα όλες όλη όλην όλης όλο ολόγυρα όλοι όλον ολονέν όλος ολότελα όλου όλους όλων
+    όλως ολωσδιόλου όμως όποια οποιαδήποτε οποίαν οποιανδήποτε οποίας οποίος οποιασδήποτε οποιδήποτε
+    όποιες οποιεσδήποτε όποιο οποιοδηήποτε όποιοι όποιον οποιονδήποτε όποιος οποιοσδήποτε
+    οποίου οποιουδήποτε οποίους οποιουσδήποτε οποίων οποιωνδήποτε όποτε οποτεδήποτε όπου
+    οπουδήποτε όπως ορισμένα ορισμένες ορισμένων ορισμένως όσα οσαδήποτε όσες οσεσδήποτε
+    όση οσηδήποτε όσην οσηνδήποτε όσης οσησδήποτε όσο οσοδήποτε όσοι οσοιδήποτε όσον οσονδήποτε
+    όσος οσοσδήποτε όσου οσουδήποτε όσους οσουσδήποτε όσων οσωνδήποτε όταν ότι οτιδήποτε
+    ότου ου ουδέ ούτε όχι οποία  οποίες  οποίο  οποίοι  οπότε  ος
+
+    πάνω  παρά  περί  πολλά  πολλές  πολλοί  πολλούς  που  πρώτα  πρώτες  πρώτη  πρώτο  πρώτος  πως
+    πάλι πάντα πάντοτε παντού πάντως πάρα πέρα πέρι περίπου περισσότερο πέρσι πέρυσι πια πιθανόν
+    πιο πίσω πλάι πλέον πλην ποιά ποιάν ποιάς ποιές ποιό ποιοί ποιόν ποιός ποιού ποιούς
+    ποιών πολύ πόσες πόση πόσην πόσης πόσοι πόσος πόσους πότε ποτέ πού πούθε πουθενά πρέπει
+    πριν προ προκειμένου πρόκειται πρόπερσι προς προτού προχθές προχτές πρωτύτερα πώς
+
+    σαν σας σε σεις σου στα στη στην στης στις στο στον στου στους στων συγχρόνως
+    συν συνάμα συνεπώς συχνάς συχνές συχνή συχνήν συχνής συχνό συχνοί συχνόν
+    συχνός συχνού συχνούς συχνών συχνώς σχεδόν
+
+    τα τάδε ταύτα ταύτες ταύτη ταύτην ταύτης ταύτοταύτον ταύτος ταύτου ταύτων τάχα τάχατε
+    τελευταία  τελευταίο  τελευταίος  τού  τρία  τρίτη  τρεις τελικά τελικώς τες τέτοια τέτοιαν
+    τέτοιας τέτοιες τέτοιο τέτοιοι τέτοιον τέτοιος τέτοιου
+    τέτοιους τέτοιων τη την της τι τίποτα τίποτε τις το τοι τον τοσ τόσα τόσες τόση τόσην
+    τόσης τόσο τόσοι τόσον τόσος τόσου τόσους τόσων τότε του τουλάχιστο τουλάχιστον τους τούς τούτα
+    τούτες τούτη τούτην τούτης τούτο τούτοι τούτοις τούτον τούτος τούτου τούτους τούτων τυχόν
+    των τώρα
+
+    υπ υπέρ υπό υπόψη υπόψιν ύστερα
+
+    χωρίς χωριστά
+
+    ω ως ωσάν ωσότου ώσπου ώστε ωστόσο ωχ κ κι
+    """.translate(GREEK_ACCENTS).split()
+)
+
+# topic-model noise: stance words and the bill itself, removed as substrings
+TOPIC_NOISE_PHRASES = (
+    "διαφωνω",
+    "συμφωνω",
+    "νομοσχεδιο",
+    "νομοσχεδιου"
+)
+TOPIC_NOISE_PATTERN = re.compile("|".join(map(re.escape, TOPIC_NOISE_PHRASES)), flags=re.IGNORECASE)
+
+REPEATED_PATTERN = re.compile(
+    r'''
+    \b\w*(\w)\1{2,}\b | # single character repeated 3+ times
+    \b(\w{2})\2{2,}\b # a two-character sequence repeated 3+ times
+    ''',
+    flags=re.VERBOSE | re.UNICODE
+)
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# `normalize` steps, kept here so the corpus store can normalize without the NLP stack
+GIPHY_PATTERN = re.compile(r'!\[[^\]]*\]\(giphy\|[^)]+\)')
+MARKDOWN_IMAGE_PATTERN = re.compile(r'!\[[^\]]*\]\([^\)]*\)')
+PARENTHESIZED_URL_PATTERN = re.compile(r'\(\s*https?://[^)]+\)')
+URL_PATTERN = re.compile(r'http\S+|www\.\S+|https\S+')
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+EMOJI_PATTERN = re.compile(
+    "["
+    "\U0001F600-\U0001F64F" # emoticons
+    "\U0001F300-\U0001F5FF" # symbols & pictographs
+    "\U0001F680-\U0001F6FF" # transport & map
+    "\U0001F1E0-\U0001F1FF" # flags
+    "\U00002702-\U000027B0" # dingbats
+    "\U000024C2-\U0001F251" # enclosed chars
+    "\U0000200D" # zero-width joiner
+    "\U0001F900-\U0001F9FF" # supplemental symbols
+    "\U0001FA70-\U0001FAFF" # extended-A
+    "\U0001FAD0-\U0001FADF" # food & drink
+    "]+", flags=re.UNICODE
+)
+DIGITS_PATTERN = re.compile(r'\d+')
+SPECIAL_CHARACTERS_PATTERN = re.compile(r'[^\w\s@.?!;]', flags=re.UNICODE)
+
+def normalize_text(text: str) -> str:
+    """
+    Implementation of `data_cleaning.normalize`, see its docstring for the steps.
+    """
+    text = GIPHY_PATTERN.sub(' ', text)
+    text = MARKDOWN_IMAGE_PATTERN.sub(' ', text)
+    text = PARENTHESIZED_URL_PATTERN.sub(' ', text)
+    text = URL_PATTERN.sub(' ', text)
+    text = HTML_TAG_PATTERN.sub(' ', text)
+    text = EMOJI_PATTERN.sub(' ', text)
+    text = DIGITS_PATTERN.sub(' ', text)
+    text = SPECIAL_CHARACTERS_PATTERN.sub(' ', text)
+    text = text.replace('_', ' ')
+    text = WHITESPACE_PATTERN.sub(' ', text).strip().lower()
+    return text.translate(GREEK_ACCENTS)
+
+# Reddit: comments that are bot or moderator boilerplate are dropped entirely
+REDDIT_REMOVAL_TRIGGERS = (
+    "δεν επιτρέπονται σύνδεσμοι προς σελίδες google amp το σχόλιό σου έχει αφαιρεθεί μπορείς όμως να το",
+    "δεν επιτρεπονται συνδεσμοι προς σελιδες google amp το σχολιο σου εχει αφαιρεθει μπορεις ομως να το επεξεργαστεις και να ενημερωσεις τους",
+    "ο τίτλος στο σαιτ αλλάζει συνεχώς για αυτό πιθανότατα",
+    "ο τιτλος στο σαιτ αλλαζει συνεχως για αυτο πιθανοτατα"
+)
+REDDIT_TRIGGER_PATTERN = re.compile("|".join(map(re.escape, REDDIT_REMOVAL_TRIGGERS)))
+# applied one after the other (as chained str.replace), since removing one phrase can join another
+REDDIT_NOISE_PHRASES = ("deleted", "removed", "quot", "href")
+
+YOUTUBE_REPLY_PATTERN = re.compile(r"^@\S+\s+") # remaining replying names
+YOUTUBE_MENTION_PATTERN = re.compile(r"@\w+")
+YOUTUBE_NOISE_PHRASES = ("quot", "href")
+
+PLATFORMS = ("reddit", "youtube")
+
+def remove_platform_noise(text: str, platform: Optional[str] = None) -> str:
+    """
+    Platform specific noise removal shared by `data_cleaning.reddit_specific` and
+    `data_cleaning.youtube_specific`. Whitespace is left as is.
+
+    Args:
+        text (str): Normalized text
+        platform (str | None): "reddit", "youtube" or None for no platform noise
+
+    Returns:
+        text (str): The text without the platform noise
+    """
+    if platform == "reddit":
+        if REDDIT_TRIGGER_PATTERN.search(text):
+            return ""
+        for phrase in REDDIT_NOISE_PHRASES:
+            text = text.replace(phrase, "")
+    elif platform == "youtube":
+        text = YOUTUBE_REPLY_PATTERN.sub("", text)
+        for phrase in YOUTUBE_NOISE_PHRASES:
+            text = text.replace(phrase, "")
+        text = YOUTUBE_MENTION_PATTERN.sub(" ", text)
+    elif platform is not None:
+        raise ValueError(f"Unknown platform '{platform}', expected one of {PLATFORMS} or None.")
+    return text
+
+def filter_tokens(text: str, platform: Optional[str] = None) -> List[str]:
+    """
+    Platform noise removal, topic-model noise and repeated-character stripping and
+    Greek stopword removal in a single tokenization pass.
+
+    Equivalent to `clean_text(cleaning_object, <platform>_specific(text)).split()`.
+
+    Args:
+        text (str): Normalized text
+        platform (str | None): "reddit", "youtube" or None for no platform noise
+
+    Returns:
+        tokens (List[str]): The remaining tokens
+    """
+    text = remove_platform_noise(text, platform)
+    text = TOPIC_NOISE_PATTERN.sub("", text)
+    text = REPEATED_PATTERN.sub("", text)
+    return [word for word in text.split() if word not in GREEK_STOPWORDS]
+
+def filter_batch(texts: Iterable[str], platform: Optional[str] = None) -> List[str]:
+    """
+    Applies `filter_tokens` to every text and joins the tokens back with single spaces,
+    ready for chunking in the topic model.
+
+    Args:
+        texts (Iterable[str]): Normalized texts
+        platform (str | None): "reddit", "youtube" or None for no platform noise
+
+    Returns:
+        cleaned (List[str]): The filtered texts, in the input order
+    """
+    return [" ".join(filter_tokens(text, platform)) for text in texts]
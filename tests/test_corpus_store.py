@@ -0,0 +1,112 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.corpus_store import corpus_store
+
+# Reddit dates are written without a timezone, YouTube dates with a UTC offset
+DATA = pd.DataFrame([
+    ("reddit", "pre", "2024-02-15T22:46:24", "Ο γάμος είναι δικαίωμα", -1, 0.10),
+    ("youtube", "pre", "2024-02-16T07:31:56+00:00", "ισότητα στο γάμο τώρα", 2, 0.90),
+    ("opengov", "during", "2024-02-16 00:00:00", "άλλο θέμα", np.nan, np.nan),
+    ("reddit", "during", "2024-03-01T10:00:00", "γάμοι και ισότητα", 2, 0.82),
+    ("youtube", "post", "2024-03-01T10:00:00+02:00", "στο γάμο", 0, 0.50),
+    ("reddit", "post", "2024-04-01T00:00:00", "γαμ", 1, 0.95),
+], columns=["platform", "period", "date", "text", "dominant_topic", "topic_prob"])
+DATA["comment_id"] = [f"C-{i}" for i in range(len(DATA))]
+
+# C-0 has no author, as for comments missing from the anonymized outputs
+AUTHOR_IDS = {f"C-{i}": 6271 + i for i in range(1, len(DATA))}
+
+
+def ids(frame):
+    return [int(comment_id.split("-")[1]) for comment_id in frame["comment_id"]]
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "corpus.db")
+
+
+@pytest.fixture
+def store(db_path):
+    with corpus_store.build(db_path, DATA, AUTHOR_IDS) as built:
+        yield built
+
+
+def test_mixed_date_formats(store):
+    dates = store.query(columns=["comment_id", "date"])["date"]
+    assert dates.notna().all()
+    assert dates[1] == pd.Timestamp("2024-02-16 07:31:56")
+    # offsets are converted to UTC
+    assert dates[4] == pd.Timestamp("2024-03-01 08:00:00")
+    assert store.count(platform="youtube", date_from="2024-01-01") == 2
+
+
+def test_inclusive_date_bounds(store):
+    result = store.query(date_from="2024-02-16 07:31:56", date_to="2024-03-01 10:00:00")
+    assert ids(result) == [1, 3, 4]
+    assert ids(store.query(date_to="2024-03-01T12:00:00+02:00")) == [0, 1, 2, 3, 4]
+
+
+def test_list_filters(store):
+    assert ids(store.query(platform=["reddit", "opengov"])) == [0, 2, 3, 5]
+    assert ids(store.query(platform="reddit", period=np.array(["during", "post"]))) == [3, 5]
+
+
+def test_array_and_series_filters(store):
+    # NaN never matches, as with a boolean mask
+    assert ids(store.query(topic=DATA["dominant_topic"].unique())) == [0, 1, 3, 4, 5]
+    assert ids(store.query(topic=pd.Series([2, 0]))) == [1, 3, 4]
+    assert ids(store.query(author_id=pd.Series([6272, 6273]))) == [1, 2]
+
+
+def test_numpy_scalar_filters(store):
+    assert store.count(topic=np.int64(2)) == store.count(topic=2) == 2
+    assert store.count(author_id=np.int64(6272)) == 1
+    assert store.count(min_prob=np.float64(0.82)) == store.count(min_prob=0.82) == 3
+
+
+def test_exclude_outliers(store):
+    assert ids(store.query(exclude_outliers=True)) == [1, 3, 4, 5]
+
+
+def test_mentions(store):
+    # accents and case are normalized away, stems match as prefixes
+    assert ids(store.query(mentions="ΓΆΜ")) == [0, 1, 3, 4, 5]
+    assert store.count(mentions="γαμ") == store.count(mentions=["γαμ"])
+    assert ids(store.query(mentions="γαμ", prefix=False)) == [5]
+    assert ids(store.query(mentions=["γάμο"], prefix=False)) == [1, 4]
+    assert ids(store.query(mentions=["ισότητα στο γάμο"], prefix=False)) == [1]
+    assert ids(store.query(mentions=["στο γαμ"])) == [1, 4]
+    assert ids(store.query(mentions=["δικαίωμα", "θέμα"])) == [0, 2]
+    with pytest.raises(ValueError):
+        store.query(mentions=["123 !!"])
+
+
+def test_iter_query_and_count(store):
+    filters = {"platform": "reddit", "mentions": "γαμ"}
+    expected = store.query(columns=["comment_id", "author_id"], **filters)
+    records = list(store.iter_query(columns=["comment_id", "author_id"], **filters))
+    assert records == [{"comment_id": "C-0", "author_id": None},
+                       {"comment_id": "C-3", "author_id": 6274},
+                       {"comment_id": "C-5", "author_id": 6276}]
+    assert [r["comment_id"] for r in records] == list(expected["comment_id"])
+    assert store.count(**filters) == len(expected) == 3
+    assert "row_id" not in next(store.iter_query())
+
+
+def test_integer_author_ids(store):
+    result = store.query(columns=["comment_id", "author_id"])
+    assert str(result["author_id"].dtype) == "Int64"
+    assert result["author_id"].isna().tolist() == [True] + [False] * 5
+
+
+def test_rebuild_existing_db(store, db_path):
+    store.close()
+    with corpus_store.build(db_path, DATA.iloc[:2]) as rebuilt:
+        assert rebuilt.count() == 2
+        assert rebuilt.count(mentions="γαμ") == 2
+        assert rebuilt.count(author_id=6272) == 0
+    with corpus_store(db_path) as reopened:
+        assert ids(reopened.query(mentions="ισοτητα")) == [1]
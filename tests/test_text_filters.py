@@ -0,0 +1,102 @@
+"""
+Input/expected pairs for the compiled filters. The expected outputs were produced by the
+per-call implementations they replaced (`reddit_specific`, `youtube_specific`, `clean_text`
+and `remove_greek_stopwords` before the filters were hoisted into `utils.text_filters`).
+"""
+import pytest
+
+from utils.text_filters import filter_tokens, remove_platform_noise
+
+REDDIT_CASES = [
+    # trigger phrases empty the whole comment, accented or not
+    ("καλο σχολιο. δεν επιτρεπονται συνδεσμοι προς σελιδες google amp το σχολιο σου εχει αφαιρεθει "
+     "μπορεις ομως να το επεξεργαστεις και να ενημερωσεις τους", ""),
+    ("ο τίτλος στο σαιτ αλλάζει συνεχώς για αυτό πιθανότατα άλλαξε", ""),
+    ("deleted", ""),
+    # removing one phrase can join another, phrases are removed one after the other
+    ("dequotleted", "deleted"),
+    ("remdeletedoved σχολιο", "σχολιο"),
+    ("  πολλα   κενα\tεδω ", "πολλα κενα εδω"),
+    ("href link quot", "link"),
+]
+
+YOUTUBE_CASES = [
+    ("@user_1 ευχαριστω πολυ", "ευχαριστω πολυ"),
+    ("καλο @someone βιντεο @x", "καλο βιντεο"),
+    ("hrquotef", ""),
+    ("quot href τελος", "τελος"),
+    ("  @user  αρχη", "αρχη"),
+]
+
+CLEAN_TEXT_CASES = [
+    # topic noise is removed as substrings, first alternative wins
+    ("διαφωνω με το νομοσχεδιου", "υ"),
+    ("ΔΙΑΦΩΝΩ απολυτα", "απολυτα"),
+    ("νομοσχεδιοτα και", ""),
+    ("aaab συμφωνωντας", "aaab ντας"),
+    # repeated characters only drop the word part, punctuation stays
+    ("χαχαχα τελεια χααα.", "τελεια ."),
+]
+
+STOPWORD_CASES = [
+    ("και ο γαμος ειναι δικαιωμα", "γαμος δικαιωμα"),
+    # stopwords are accent-stripped, accented input is kept
+    ("είναι το δικαίωμα", "είναι δικαίωμα"),
+    ("  κι   ομως  ", ""),
+]
+
+
+@pytest.fixture(scope="module")
+def cleaner():
+    # data_cleaning loads spaCy's Greek model and the Greek NLP toolkit at import time,
+    # a missing package raises ImportError and a missing model OSError
+    try:
+        from utils.text_analysis_functions import data_cleaning
+    except (ImportError, OSError) as error:
+        pytest.skip(f"data_cleaning unavailable ({error}), only the text_filters checks ran")
+    return object.__new__(data_cleaning)
+
+
+@pytest.mark.parametrize("text, expected", REDDIT_CASES)
+def test_reddit_noise(text, expected):
+    assert filter_tokens(text, "reddit") == filter_tokens(expected)
+    assert " ".join(remove_platform_noise(text, "reddit").split()) == expected
+
+
+@pytest.mark.parametrize("text, expected", YOUTUBE_CASES)
+def test_youtube_noise(text, expected):
+    assert filter_tokens(text, "youtube") == filter_tokens(expected)
+    assert " ".join(remove_platform_noise(text, "youtube").split()) == expected
+
+
+@pytest.mark.parametrize("text, expected", CLEAN_TEXT_CASES + STOPWORD_CASES)
+def test_filter_tokens(text, expected):
+    assert " ".join(filter_tokens(text)) == expected
+
+
+def test_unknown_platform():
+    with pytest.raises(ValueError):
+        remove_platform_noise("κειμενο", "twitter")
+    with pytest.raises(ValueError):
+        filter_tokens("κειμενο", "twitter")
+
+
+@pytest.mark.parametrize("text, expected", REDDIT_CASES)
+def test_reddit_specific(cleaner, text, expected):
+    assert cleaner.reddit_specific(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", YOUTUBE_CASES)
+def test_youtube_specific(cleaner, text, expected):
+    assert cleaner.youtube_specific(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", CLEAN_TEXT_CASES)
+def test_clean_text(cleaner, text, expected):
+    from utils.modeling_helpers import clean_text
+    assert clean_text(cleaner, text) == expected
+
+
+@pytest.mark.parametrize("text, expected", STOPWORD_CASES)
+def test_remove_greek_stopwords(cleaner, text, expected):
+    assert cleaner.remove_greek_stopwords(text) == expected